@@ -2,10 +2,10 @@
 import os
 import sys
 
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator
 
-from utils import showSuccess, showWarn, showInfo, showOk
+from utils import showSuccess, showWarn, showInfo, showOk, batchedOutput
 
 # --- Headers ---
 commonHeader: str = """
@@ -14,41 +14,64 @@ commonHeader: str = """
 // (C) 2025 VaLibTeam
 """.strip()
 
-headerHeader: str = commonHeader
-sourceHeader: str = commonHeader
+# headers and sources share the same expected header; split it once
+HEADER_LINES: list[str] = commonHeader.splitlines()
+
+HEADER_BYTES: bytes = commonHeader.encode()
+HEADER_PREFIX: bytes = HEADER_BYTES + b"\n"
+
+_EXTS: tuple[str, ...] = (".cpp", ".hpp")
 
 # --- Helpers ---
 def readFileLines(path: str) -> list[str]:
     with open(path, 'r', encoding='utf-8') as f:
         return f.read().splitlines()
 
+def readFileHead(path: str) -> bytes:
+    # enough to cover the header plus a "#pragma once" line
+    with open(path, 'rb') as f:
+        return f.read(len(HEADER_BYTES) + 64)
+
 def writeFileLines(path: str, lines: list[str]):
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines) + '\n')
+    # writelines avoids joining the whole file into one big string first
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(line + '\n' for line in lines)
+
+def checkHeaderBytes(buf: bytes) -> bool:
+    # one memcmp against the raw prefix instead of per-line comparisons
+    return buf.startswith(HEADER_PREFIX) or buf == HEADER_BYTES
+
+def hasPragmaOnceBytes(buf: bytes) -> bool:
+    start: int = len(HEADER_PREFIX)
+    end: int = buf.find(b"\n", start)
+    if end == -1:
+        end = len(buf)
+
+    return buf[start:end].strip() == b"#pragma once"
 
-def checkHeader(lines: list[str], expected: str) -> bool:
-    headerLines: list[str] = expected.splitlines()
+def checkHeader(lines: list[str], headerLines: list[str]) -> bool:
     if len(lines) < len(headerLines):
         return False
 
     return lines[:len(headerLines)] == headerLines
 
-def hasPragmaOnce(lines: list[str], expectedHeader: str) -> bool:
-    headerLines: list[str] = expectedHeader.splitlines()
-    if len(lines) <= len(headerLines):
+def hasPragmaOnce(lines: list[str], headerLen: int) -> bool:
+    if len(lines) <= headerLen:
         return False
 
-    return lines[len(headerLines)].strip() == "#pragma once"
+    return lines[headerLen].strip() == "#pragma once"
 
-def fixFile(path: str, isHeader: bool, expectedHeader: str):
-    lines: list[str] = readFileLines(path) if os.path.exists(path) else []
-    headerLines: list[str] = expectedHeader.splitlines()
+def fixFile(path: str, isHeader: bool, headerLines: list[str]):
+    # the caller just read the file, so it exists
+    lines: list[str] = readFileLines(path)
+
+    headerLen: int = len(headerLines)
 
     # determine where real content starts
     start: int = 0
-    if checkHeader(lines, expectedHeader):
-        start = len(headerLines)
-        if isHeader and hasPragmaOnce(lines, expectedHeader):
+    if checkHeader(lines, headerLines):
+        start = headerLen
+        if isHeader and hasPragmaOnce(lines, headerLen):
             start += 1
 
     # skip empty lines
@@ -57,7 +80,7 @@ def fixFile(path: str, isHeader: bool, expectedHeader: str):
 
     newLines: list[str] = headerLines[:]
 
-    if isHeader and not hasPragmaOnce(lines, expectedHeader):
+    if isHeader and not hasPragmaOnce(lines, headerLen):
         newLines.append("#pragma once")
 
     newLines.append("")  # blank line
@@ -66,40 +89,52 @@ def fixFile(path: str, isHeader: bool, expectedHeader: str):
     writeFileLines(path, newLines)
     showInfo("Fixed:", path)
 
-def processFile(path: str, fix: bool, isHeader: bool, expectedHeader: str) -> bool:
-    lines: list[str] = readFileLines(path)
+def processFile(path: str, fix: bool, isHeader: bool, headerLines: list[str]) -> bool:
+    # the checks only look at the header prefix, so don't slurp the whole file
+    head: bytes = readFileHead(path)
 
-    if not checkHeader(lines, expectedHeader):
+    if not checkHeaderBytes(head):
         showWarn("Invalid or missing header in:", path)
         if fix:
-            fixFile(path, isHeader, expectedHeader)
+            fixFile(path, isHeader, headerLines)
 
         return True
 
-    if isHeader and (not hasPragmaOnce(lines, expectedHeader)):
+    if isHeader and (not hasPragmaOnceBytes(head)):
         showWarn("Missing #pragma once in:", path)
         if fix:
-            fixFile(path, isHeader, expectedHeader)
+            fixFile(path, isHeader, headerLines)
 
         return True
 
     return False
 
+def _scan(root: str) -> Generator[str, None, None]:
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.name.startswith("."):
+                continue  # skip hidden dirs like .git
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan(entry.path)
+            elif entry.name.endswith(_EXTS):
+                yield entry.path
+
 def findFiles() -> Generator[str, None, None]:
-    for root, _, files in os.walk("."):
-        for file in files:
-            if file.endswith(".cpp") or file.endswith(".hpp"):
-                yield os.path.join(root, file)
+    yield from _scan(".")
 
 def main() -> int:
     fix: bool = "--fix" in sys.argv
 
-    fixed: bool = False
-    for path in findFiles():
-        ext: str = Path(path).suffix
-        isHeader: bool = ext == ".hpp"
-        header: str = headerHeader if isHeader else sourceHeader
-        fixed = processFile(path, fix, isHeader, header) or fixed
+    # the per-file work is I/O-bound, so fan it out over a thread pool;
+    # batchedOutput serializes the workers' show* lines under its lock and
+    # writes them in whole-line chunks, so no findings are lost or torn
+    workers: int = min(32, (os.cpu_count() or 1) * 4)
+    with batchedOutput():
+        paths: list[str] = list(findFiles())
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(lambda p: processFile(p, fix, p.endswith(".hpp"), HEADER_LINES), paths))
+
+    fixed: bool = any(results)
 
     if not fixed:
         showOk("Nothing to do!")
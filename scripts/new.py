@@ -3,7 +3,7 @@ from utils import showError
 from utils import VERSION
 
 from datetime import datetime
-import platform, subprocess
+import subprocess, tempfile
 import os, sys, shlex
 
 # -------- Constants --------- #
@@ -31,43 +31,61 @@ if EDITOR := os.getenv("EDITOR"):
 
 # -------- Functions --------- #
 def openEditor() -> str:
-    tmpFile: str = "/tmp/.changelog_message" if platform.system() == "Linux" else R"C:\Windows\Temp\.changelog_message"
+    with tempfile.NamedTemporaryFile("w", suffix=".md", delete=False) as tf:
+        tmpFile: str = tf.name
     subprocess.call(shlex.split(defaultEditor) + [tmpFile,])
 
-    if os.path.exists(tmpFile):
+    try:
         with open(tmpFile, "r") as f:
-            message: str = f.read().strip()
-        os.remove(tmpFile)
-        return message
-    return ""
+            return f.read().strip()
+    finally:
+        os.unlink(tmpFile)
 
-def ensureChangelogExists() -> str:
+def readChangelogLines() -> list[str]:
     if not os.path.exists(CHANGELOG_PATH):
         with open(CHANGELOG_PATH, "w") as f:
             f.write("# Changelog\n")
-        pass
-    pass
+        return ["# Changelog"]
 
+    # iterate instead of read().splitlines() to avoid a second full copy
     with open(CHANGELOG_PATH, "r") as f:
-        return f.read()
+        return [line.rstrip("\n") for line in f]
+
+def spliceChangelog(lines: list[str], idx: int, block: list[str]):
+    # insert the block before line idx by rewriting only the tail of the file
+    offset: int = sum(len(line.encode()) + 1 for line in lines[:idx])
+    insert: bytes = ("\n".join(block) + "\n").encode()
+
+    with open(CHANGELOG_PATH, "r+b") as f:
+        size: int = f.seek(0, 2)
+        if offset > size:  # inserting after a last line with no trailing newline
+            offset = size
+            insert = b"\n" + "\n".join(block).encode()
+
+        f.seek(offset)
+        tail: bytes = f.read()
+        f.seek(offset)
+        f.write(insert + tail)
+        f.truncate()
 
 def updateChangelog(changeType: str, module: str, msg: str):
     today: str = datetime.now().strftime("%Y-%m-%d")
     sectionHeader: str = f"## [{VERSION}] - {today}"
     changeHeading: str = f"### {CHANGE_TYPES[changeType]}"
 
-    content: str = ensureChangelogExists()
-    lines = content.splitlines()
+    lines: list[str] = readChangelogLines()
 
     total: str = f"{f'**[ {module} ]**' if (module in MODULES) else f'**( {module} )**'} {msg}"
 
-    if sectionHeader not in content:
+    # one pass: find the section header index, -1 if absent
+    idx: int = next((i for i, line in enumerate(lines) if line == sectionHeader), -1)
+
+    if idx == -1:
         newSection: str = f"\n{sectionHeader}\n{changeHeading}\n- {total}\n"
         with open(CHANGELOG_PATH, "a") as f:
             f.write(newSection)
         pass
     else:
-        idx: int = lines.index(sectionHeader)
         insertionPoint = idx + 1
         foundHeading: bool = False
 
@@ -79,20 +97,26 @@ def updateChangelog(changeType: str, module: str, msg: str):
                 break
             insertionPoint += 1
 
+        # compute the final insertion index and block, then splice once
         if foundHeading:
-            headingIdx: int = insertionPoint + 1
-            while headingIdx < len(lines) and (lines[headingIdx].strip().startswith("- ") or lines[headingIdx].strip() == ""):
-                headingIdx += 1
-            lines.insert(headingIdx, f"- {total}")
+            ip: int = insertionPoint + 1
+            while ip < len(lines) and (lines[ip].strip().startswith("- ") or lines[ip].strip() == ""):
+                ip += 1
+            block: list[str] = [f"- {total}"]
         else:
-            insertionPoint += 1
-            lines.insert(insertionPoint, f"{changeHeading}\n- {total}")
+            ip = insertionPoint + 1
+            block = [changeHeading, f"- {total}"]
 
-        with open(CHANGELOG_PATH, "w") as f:
-            f.write("\n".join(lines))
+        spliceChangelog(lines, ip, block)
+
+def gitCommit(msg: str):
+    # commit -a covers tracked files in one process; only pay for git add
+    # when there are untracked files to pick up
+    untracked = subprocess.run(["git", "ls-files", "-o", "--exclude-standard"], capture_output=True)
+    if untracked.stdout.strip():
+        subprocess.run(["git", "add", "."])
 
-def gitCommit(msg: str): subprocess.run(["git", "commit", "-m", msg])
-def gitAdd():            subprocess.run(["git", "add", "."])
+    subprocess.run(["git", "commit", "-a", "-m", msg], stdout=subprocess.DEVNULL)
 
 # -------- Main --------- #
 def main() -> int:
@@ -109,7 +133,6 @@ def main() -> int:
 
     updateChangelog(changeType, module, msg)
 
-    gitAdd()
     gitCommit(msg)
 
     return SuccessExit
@@ -1,4 +1,7 @@
 import sys
+import threading
+
+from contextlib import contextmanager
 
 # === ANSI & Messaging ===
 RED = "\033[31m"
@@ -10,50 +13,74 @@ RESET = "\033[0m"
 notExit = -123
 colors = True
 
+# prefixes and line ending resolved once at import, so each show* call
+# is a single print without per-call f-string formatting
+_PRE_ERROR = "\033[1;31m[ ERROR ]:\033[91m" if colors else "[ ERROR ]:"
+_PRE_SUCCESS = "\033[1;32m[ SUCCESS ]:\033[92m" if colors else "[ SUCCESS ]:"
+_PRE_WARN = "\033[1;33m[ WARNING ]:\033[93m" if colors else "[ WARNING ]:"
+_PRE_INFO = "\033[1;34m[ INFO ]:\033[94m" if colors else "[ INFO ]:"
+_PRE_OK = "\033[1;92m[ OK ]:\033[38;5;36m" if colors else "[ OK ]:"
+_PRE_TIP = "\033[1;35m[ TIP ]:\033[95m" if colors else "[ TIP ]:"
+_END = "\033[0m\n" if colors else "\n"
+
+# when batching is active, show* lines are collected here and written in
+# chunks instead of one flushing print per message; the lock keeps the
+# append/join/clear sequence atomic when callers batch from threads
+_batch: list[str] | None = None
+_batchLock = threading.Lock()
+_BATCH_SIZE = 256
+
+def _flushLocked():
+    if _batch:
+        sys.stdout.write("".join(_batch))
+        sys.stdout.flush()
+        _batch.clear()
+
+def _flushBatch():
+    with _batchLock:
+        _flushLocked()
+
+@contextmanager
+def batchedOutput():
+    global _batch
+    _batch = []
+    try:
+        yield
+    finally:
+        _flushBatch()
+        _batch = None
+
+def _show(prefix: str, msg: tuple):
+    if _batch is None:
+        print(prefix, *msg, end=_END)
+        return
+
+    line: str = " ".join((prefix,) + msg) + _END
+    with _batchLock:
+        _batch.append(line)
+        if len(_batch) >= _BATCH_SIZE:
+            _flushLocked()
+
 def showError(code: int, *msg):
-    message = " ".join(msg)
-    if colors:
-        print(f"\033[1;31m[ ERROR ]:\033[91m {message}\033[0m")
-    else:
-        print(f"[ ERROR ]: {message}")
-    
+    _show(_PRE_ERROR, msg)
+
     if code != notExit:
         sys.exit(code)
 
 def showSuccess(*msg):
-    message = " ".join(msg)
-    if colors:
-        print(f"\033[1;32m[ SUCCESS ]:\033[92m {message}\033[0m")
-    else:
-        print(f"[ SUCCESS ]: {message}")
+    _show(_PRE_SUCCESS, msg)
 
 def showWarn(*msg):
-    message = " ".join(msg)
-    if colors:
-        print(f"\033[1;33m[ WARNING ]:\033[93m {message}\033[0m")
-    else:
-        print(f"[ WARNING ]: {message}")
+    _show(_PRE_WARN, msg)
 
 def showInfo(*msg):
-    message = " ".join(msg)
-    if colors:
-        print(f"\033[1;34m[ INFO ]:\033[94m {message}\033[0m")
-    else:
-        print(f"[ INFO ]: {message}")
+    _show(_PRE_INFO, msg)
 
 def showOk(*msg):
-    message = " ".join(msg)
-    if colors:
-        print(f"\033[1;92m[ OK ]:\033[38;5;36m {message}\033[0m")
-    else:
-        print(f"[ OK ]: {message}")
+    _show(_PRE_OK, msg)
 
 def showTip(*msg):
-    message = " ".join(msg)
-    if colors:
-        print(f"\033[1;35m[ TIP ]:\033[95m {message}\033[0m")
-    else:
-        print(f"[ TIP ]: {message}")
-    
+    _show(_PRE_TIP, msg)
+
 # VaLib Version
 VERSION: str = '1.8.0'
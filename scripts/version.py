@@ -25,16 +25,47 @@ FILE_UTILS_PY = Path("./utils.py")
 FILE_UTILS_SH = Path("./utils.sh")
 FILE_VERSION_HPP = Path("../Include/VaLib/Version.hpp")
 
-# --- regex patterns ---
-PY_VER_PATTERN = r"^\s*(VERSION\s*:\s*str\s*=\s*)'(\d+)\.(\d+)\.(\d+)'"
-SH_VER_PATTERN = r"^\s*(VERSION\s*=\s*)['\"](\d+)\.(\d+)\.(\d+)['\"]"
+# --- regex patterns (compiled once at import) ---
+PY_VER_RE = re.compile(r"^\s*(VERSION\s*:\s*str\s*=\s*)'(\d+)\.(\d+)\.(\d+)'", re.MULTILINE)
+SH_VER_RE = re.compile(r"^\s*(VERSION\s*=\s*)['\"](\d+)\.(\d+)\.(\d+)['\"]", re.MULTILINE)
 
-CPP_MAJOR_PATTERN = r"^\s*(#define\s+VaLib_VERSION_MAJOR\s+)(\d+)"
-CPP_MINOR_PATTERN = r"^\s*(#define\s+VaLib_VERSION_MINOR\s+)(\d+)"
-CPP_PATCH_PATTERN = r"^\s*(#define\s+VaLib_VERSION_PATCH\s+)(\d+)"
+CPP_MAJOR_RE = re.compile(r"^\s*(#define\s+VaLib_VERSION_MAJOR\s+)(\d+)", re.MULTILINE)
+CPP_MINOR_RE = re.compile(r"^\s*(#define\s+VaLib_VERSION_MINOR\s+)(\d+)", re.MULTILINE)
+CPP_PATCH_RE = re.compile(r"^\s*(#define\s+VaLib_VERSION_PATCH\s+)(\d+)", re.MULTILINE)
+
+# extracts all three macros in one match for the no-op prescan
+CPP_CUR_RE = re.compile(
+    r"^\s*#define\s+VaLib_VERSION_MAJOR\s+(\d+)\s*\n"
+    r"\s*#define\s+VaLib_VERSION_MINOR\s+(\d+)\s*\n"
+    r"\s*#define\s+VaLib_VERSION_PATCH\s+(\d+)", re.MULTILINE)
 
 type Version = tuple[int, int, int]
 
+def resolvePath(path: Path) -> Path:
+    try:
+        return path.resolve()
+    except OSError:
+        return path.absolute()
+
+def quotedVersionCurrent(content: str, ver: Version) -> bool:
+    return f"'{ver[0]}.{ver[1]}.{ver[2]}'" in content
+
+def cppVersionCurrent(content: str, ver: Version) -> bool:
+    m = CPP_CUR_RE.search(content)
+    return m is not None and tuple(int(g) for g in m.groups()) == ver
+
+# per file: a cheap already-current check plus (regex, replacement) pairs,
+# keyed on the path resolved once at import
+HANDLERS: dict[Path, tuple] = {
+    resolvePath(FILE_UTILS_PY): (quotedVersionCurrent, [(PY_VER_RE, lambda m, v: f"{m[1]}'{v[0]}.{v[1]}.{v[2]}'")]),
+    resolvePath(FILE_UTILS_SH): (quotedVersionCurrent, [(SH_VER_RE, lambda m, v: f"{m[1]}'{v[0]}.{v[1]}.{v[2]}'")]),
+    resolvePath(FILE_VERSION_HPP): (cppVersionCurrent, [
+        (CPP_MAJOR_RE, lambda m, v: f"{m[1]}{v[0]}"),
+        (CPP_MINOR_RE, lambda m, v: f"{m[1]}{v[1]}"),
+        (CPP_PATCH_RE, lambda m, v: f"{m[1]}{v[2]}"),
+    ]),
+}
+
 class InvalidArgsError(Exception): pass
 class UnknownCommandError(Exception): pass
 class InvalidBumpTargetError(Exception): pass
@@ -61,17 +92,14 @@ def bumpVersion(ver: Version, part: str):
 
 def updateFile(path: Path, ver: Version):
     content: str = path.read_text()
-    newContent: str = content
 
-    flags = re.MULTILINE
-    if path.resolve() == FILE_UTILS_PY.resolve():
-        newContent = re.sub(PY_VER_PATTERN, lambda m: f"{m[1]}'{ver[0]}.{ver[1]}.{ver[2]}'", content, flags=flags)
-    elif path.resolve() == FILE_UTILS_SH.resolve():
-        newContent = re.sub(SH_VER_PATTERN, lambda m: f"{m[1]}'{ver[0]}.{ver[1]}.{ver[2]}'", content, flags=flags)
-    elif path.resolve() == FILE_VERSION_HPP.resolve():
-        newContent = re.sub(CPP_MAJOR_PATTERN, lambda m: f"{m[1]}{ver[0]}", content, flags=flags)
-        newContent = re.sub(CPP_MINOR_PATTERN, lambda m: f"{m[1]}{ver[1]}", newContent, flags=flags)
-        newContent = re.sub(CPP_PATCH_PATTERN, lambda m: f"{m[1]}{ver[2]}", newContent, flags=flags)
+    isCurrent, subs = HANDLERS.get(resolvePath(path), (None, []))
+    if isCurrent is not None and isCurrent(content, ver):
+        return  # already at this version, skip the regex passes and the write
+
+    newContent: str = content
+    for regex, repl in subs:
+        newContent = regex.sub(lambda m: repl(m, ver), newContent)
 
     if content == newContent:
         showInfo(f"No changes made to {path}. check regex?")